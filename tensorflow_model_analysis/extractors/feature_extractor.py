@@ -72,20 +72,24 @@ def _AugmentExtracts(fpl_dict, prefix,
       col_name = util.compound_key([prefix, name])
 
     if isinstance(val, tf.SparseTensorValue):
-      extracts[col_name] = types.MaterializedColumn(
+      column = types.MaterializedColumn(
           name=col_name, value=val.values[0:_MAX_SPARSE_FEATURES_PER_COLUMN])
 
     elif isinstance(val, np.ndarray):
       val = val[0]  # only support first dim for now.
       if not np.isscalar(val):
         val = val[0:_MAX_SPARSE_FEATURES_PER_COLUMN]
-      extracts[col_name] = types.MaterializedColumn(name=col_name, value=val)
+      column = types.MaterializedColumn(name=col_name, value=val)
 
     else:
       raise TypeError(
           'Dictionary item with key %s, value %s had unexpected type %s' %
           (name, val, type(val)))
 
+    # Key by column.name, the shared copy of col_name, so that the per-example
+    # col_name string can be freed.
+    extracts[column.name] = column
+
 
 def _ParseExample(extracts):
   """Feature extraction from serialized tf.Example."""
@@ -102,7 +106,8 @@ def _ParseExample(extracts):
       values = [v for v in value.float_list.value]
     elif value.HasField('int64_list'):
       values = [v for v in value.int64_list.value]
-    extracts[key] = types.MaterializedColumn(name=key, value=values)
+    column = types.MaterializedColumn(name=key, value=values)
+    extracts[column.name] = column
 
 
 def _MaterializeFeatures(
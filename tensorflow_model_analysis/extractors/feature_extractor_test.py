@@ -122,6 +122,21 @@ class BuildDiagnosticsTableTest(testutil.TensorflowModelAnalysisTest):
         result['features__label'],
         types.MaterializedColumn(name='features__label', value=[1.0]))
 
+  def testMaterializeFeaturesKeysShareColumnNames(self):
+    example1 = self._makeExample(age=3.0, language='english', label=1.0)
+    example2 = self._makeExample(age=4.0, language='chinese', label=0.0)
+
+    result1 = feature_extractor._MaterializeFeatures(
+        {constants.INPUT_KEY: example1.SerializeToString()},
+        source=constants.INPUT_KEY)
+    result2 = feature_extractor._MaterializeFeatures(
+        {constants.INPUT_KEY: example2.SerializeToString()},
+        source=constants.INPUT_KEY)
+    key1 = [k for k in result1 if k == 'features__age'][0]
+    key2 = [k for k in result2 if k == 'features__age'][0]
+    self.assertIs(key1, key2)
+    self.assertIs(key1, result1['features__age'].name)
+
   def testMaterializeFeaturesWithBadSource(self):
     example1 = self._makeExample(age=3.0, language='english', label=1.0)
 
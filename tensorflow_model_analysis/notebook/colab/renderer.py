@@ -15,8 +15,76 @@
 
 
 
+import contextlib
+
 from tensorflow_model_analysis.notebook.colab import util
-from tensorflow_model_analysis.types_compat import Any, Dict, List, Text, Union
+from tensorflow_model_analysis.types_compat import Any, Dict, List, Optional, Text, Tuple, Union
+
+# Components queued while a batch is active, already encoded by
+# util.encode_component so that later changes to their data are not picked up,
+# or None if not batching.
+_pending_components = None  # type: Optional[List[Tuple[Text, Text]]]
+# Number of start_batch calls not yet matched by a flush_batch call.
+_batch_depth = 0
+
+
+def _render(component_name, data, config):
+  if _pending_components is None:
+    util.render_component(component_name, data, config)
+  else:
+    _pending_components.append(
+        util.encode_component(component_name, data, config))
+
+
+def render_components(components):
+  """Renders multiple views in Colab with a single display call.
+
+  Inside a batch, the views are queued with the rest of the batch instead.
+
+  Args:
+    components: A list of (component_name, data, config) tuples.
+  """
+  if _pending_components is None:
+    util.render_components(components)
+  else:
+    for component_name, data, config in components:
+      _render(component_name, data, config)
+
+
+def start_batch():
+  """Starts queuing render_* calls until the matching flush_batch call.
+
+  Batches may be nested; views are only rendered once the outermost batch is
+  flushed.
+  """
+  global _pending_components, _batch_depth
+  _batch_depth += 1
+  if _pending_components is None:
+    _pending_components = []
+
+
+def flush_batch():
+  """Ends a batch, rendering all queued views if it is the outermost one."""
+  global _pending_components, _batch_depth
+  if _batch_depth == 0:
+    return
+  _batch_depth -= 1
+  if _batch_depth:
+    return
+  components = _pending_components
+  _pending_components = None
+  if components:
+    util.render_encoded_components(components)
+
+
+@contextlib.contextmanager
+def batch():
+  """Context manager that renders all views created inside it together."""
+  start_batch()
+  try:
+    yield
+  finally:
+    flush_batch()
 
 
 def render_slicing_metrics(data,
@@ -27,7 +95,7 @@ def render_slicing_metrics(data,
     data: A list of dictionary containing metrics for correpsonding slices.
     config: A dictionary of the configuration.
   """
-  util.render_component('tfma-nb-slicing-metrics', data, config)
+  _render('tfma-nb-slicing-metrics', data, config)
 
 
 def render_time_series(
@@ -39,7 +107,7 @@ def render_time_series(
     data: A list of dictionary containing metrics for different evaluation runs.
     config: A dictionary of the configuration.
   """
-  util.render_component('tfma-nb-time-series', data, config)
+  _render('tfma-nb-time-series', data, config)
 
 
 def render_plot(
@@ -51,4 +119,4 @@ def render_plot(
     data: A dictionary containing plot data.
     config: A dictionary of the configuration.
   """
-  util.render_component('tfma-nb-plot', data, config)
+  _render('tfma-nb-plot', data, config)
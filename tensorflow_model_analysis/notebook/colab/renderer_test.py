@@ -0,0 +1,125 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Colab renderer."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import re
+
+import tensorflow as tf
+from tensorflow_model_analysis.notebook.colab import renderer
+from tensorflow_model_analysis.notebook.colab import util
+
+
+class _FakeDisplay(object):
+  """Stands in for IPython.display, recording the HTML passed to display."""
+
+  def __init__(self):
+    self.outputs = []
+
+  def HTML(self, html):  # pylint: disable=invalid-name
+    return html
+
+  def display(self, html):
+    self.outputs.append(html)
+
+
+class RendererTest(tf.test.TestCase):
+
+  def setUp(self):
+    super(RendererTest, self).setUp()
+    self._display = _FakeDisplay()
+    self._original_display = util.display
+    util.display = self._display
+
+  def tearDown(self):
+    util.display = self._original_display
+    super(RendererTest, self).tearDown()
+
+  def _elementIds(self, html):
+    return re.findall(r'<tfma-nb-[a-z-]+ id="([^"]+)">', html)
+
+  def testRenderWithoutBatch(self):
+    renderer.render_plot({'a': 1}, {'b': 2})
+    renderer.render_time_series([{'c': 3}], {})
+    self.assertEqual(2, len(self._display.outputs))
+    html = self._display.outputs[0]
+    self.assertIn('<tfma-nb-plot id=', html)
+    self.assertIn('"b"', html)
+    self.assertIn('<tfma-nb-time-series id=', self._display.outputs[1])
+
+  def testRenderBatch(self):
+    with renderer.batch():
+      renderer.render_plot({'a': 1}, {})
+      renderer.render_slicing_metrics([], {})
+      self.assertEqual([], self._display.outputs)
+    self.assertEqual(1, len(self._display.outputs))
+    html = self._display.outputs[0]
+    self.assertIn('<tfma-nb-plot id=', html)
+    self.assertIn('<tfma-nb-slicing-metrics id=', html)
+    ids = self._elementIds(html)
+    self.assertEqual(2, len(ids))
+    for element_id in ids:
+      self.assertIn("getElementById('%s')" % element_id, html)
+
+  def testNestedBatchOnlyFlushesOutermost(self):
+    with renderer.batch():
+      renderer.render_plot({}, {})
+      with renderer.batch():
+        renderer.render_plot({}, {})
+      self.assertEqual([], self._display.outputs)
+      renderer.render_plot({}, {})
+    self.assertEqual(1, len(self._display.outputs))
+    self.assertEqual(3, len(self._elementIds(self._display.outputs[0])))
+
+  def testBatchCapturesDataWhenQueued(self):
+    data = {'value': 'before'}
+    with renderer.batch():
+      renderer.render_plot(data, {})
+      data['value'] = 'after'
+    html = self._display.outputs[0]
+    self.assertIn('before', html)
+    self.assertNotIn('after', html)
+
+  def testRenderComponentsInsideBatch(self):
+    with renderer.batch():
+      renderer.render_plot({}, {})
+      renderer.render_components([('tfma-nb-time-series', [], {}),
+                                  ('tfma-nb-plot', {}, {})])
+    self.assertEqual(1, len(self._display.outputs))
+    self.assertEqual(3, len(self._elementIds(self._display.outputs[0])))
+
+  def testEmptyBatchRendersNothing(self):
+    with renderer.batch():
+      pass
+    renderer.flush_batch()
+    self.assertEqual([], self._display.outputs)
+
+  def testElementIdsAreUniqueAcrossDisplayCalls(self):
+    with renderer.batch():
+      renderer.render_plot({}, {})
+      renderer.render_plot({}, {})
+    renderer.render_plot({}, {})
+    renderer.render_plot({}, {})
+    ids = []
+    for html in self._display.outputs:
+      ids.extend(self._elementIds(html))
+    self.assertEqual(4, len(ids))
+    self.assertEqual(len(ids), len(set(ids)))
+
+
+if __name__ == '__main__':
+  tf.test.main()
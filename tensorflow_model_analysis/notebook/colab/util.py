@@ -15,11 +15,116 @@
 
 
 
+import itertools
 import json
+import math
+
 from IPython import display
+import numpy as np
 
 from tensorflow_model_analysis.types_compat import Any, Dict, List, Text, Union
 
+# orjson is an optional, Python 3 only, speedup. _encode produces the same
+# values with or without it.
+try:
+  import orjson  # pylint: disable=g-import-not-at-top
+except ImportError:
+  orjson = None
+
+
+def _numpy_to_python(obj):
+  """Converts a numpy array or scalar to Python values, as orjson does.
+
+  Floats narrower than 64 bits use their shortest round-trip representation,
+  e.g. np.float32(0.1) becomes 0.1 rather than 0.10000000149011612.
+
+  Args:
+    obj: The object to convert.
+
+  Returns:
+    The converted object.
+
+  Raises:
+    TypeError: If obj is not a numpy array or scalar.
+  """
+  if isinstance(obj, np.ndarray):
+    if obj.dtype.kind == 'f' and obj.dtype.itemsize < 8:
+      return [_numpy_to_python(v) for v in obj]
+    return obj.tolist()
+  if isinstance(obj, np.floating) and obj.dtype.itemsize < 8:
+    return float(str(obj))
+  if isinstance(obj, np.generic):
+    return obj.item()
+  raise TypeError('%r is not JSON serializable' % (obj,))
+
+
+def _to_json_compatible(obj):
+  """Converts numpy values to Python ones and non-finite floats to None."""
+  if isinstance(obj, dict):
+    return {k: _to_json_compatible(v) for k, v in obj.items()}
+  if isinstance(obj, (list, tuple)):
+    return [_to_json_compatible(v) for v in obj]
+  if isinstance(obj, (np.ndarray, np.generic)):
+    return _to_json_compatible(_numpy_to_python(obj))
+  if isinstance(obj, float) and (math.isnan(obj) or math.isinf(obj)):
+    return None
+  return obj
+
+
+def _encode(obj):
+  """Serializes obj to a JSON string, using orjson when it is available.
+
+  Numpy values are serialized as their Python equivalents. NaN and Infinity
+  are serialized as null, since JSON.parse rejects them.
+
+  Args:
+    obj: The object to serialize.
+
+  Returns:
+    The JSON string.
+  """
+  if orjson is not None:
+    try:
+      encoded = orjson.dumps(
+          obj, option=orjson.OPT_SERIALIZE_NUMPY |
+          orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    except orjson.JSONEncodeError:
+      # E.g. integers wider than 64 bits, which json handles.
+      pass
+    else:
+      # json escapes these line terminators, which older JavaScript engines do
+      # not allow unescaped inside the string literal the payload goes into.
+      return encoded.replace(u'\u2028', u'\\u2028').replace(
+          u'\u2029', u'\\u2029')
+  try:
+    return json.dumps(obj, allow_nan=False, default=_numpy_to_python)
+  except ValueError:
+    # The payload contains NaN or Infinity; only then pay for a Python-level
+    # copy that replaces them.
+    return json.dumps(_to_json_compatible(obj))
+
+
+# Source of element ids. All outputs of a Colab cell share one document, so ids
+# must be unique across display calls, not just within one.
+_element_ids = itertools.count()
+
+_TEMPLATE = """
+          <link rel="import"
+          href="/nbextensions/tfma_widget_js/vulcanized_template.html">
+          {elements}
+          <script>
+          {scripts}
+          </script>
+          """
+
+_ELEMENT_TEMPLATE = '<{component_name} id="{element_id}"></{component_name}>'
+
+_SCRIPT_TEMPLATE = """(function() {{
+            const element = document.getElementById('{element_id}');
+            element.config = JSON.parse('{config}');
+            element.data = JSON.parse('{data}');
+          }})();"""
+
 
 def render_component(
     component_name,
@@ -36,17 +141,57 @@ def render_component(
     data: A dictionary containing data for visualization.
     config: A dictionary containing the configuration.
   """
+  render_components([(component_name, data, config)])
+
+
+def render_components(
+    components):
+  """Renders the specified components in Colab with a single display call.
+
+  Args:
+    components: A list of (component_name, data, config) tuples. See
+      render_component for details.
+  """
+  render_encoded_components(
+      [encode_component(component_name, data, config)
+       for component_name, data, config in components])
+
+
+def encode_component(
+    component_name, data,
+    config):
+  """Encodes a component for render_encoded_components.
+
+  data and config are serialized immediately, so later changes to them do not
+  affect the rendered component.
+
+  Args:
+    component_name: The name of the component to render.
+    data: A dictionary containing data for visualization.
+    config: A dictionary containing the configuration.
+
+  Returns:
+    An opaque encoded component.
+  """
+  element_id = 'tfma-component-%d' % next(_element_ids)
+  element = _ELEMENT_TEMPLATE.format(
+      component_name=component_name, element_id=element_id)
+  script = _SCRIPT_TEMPLATE.format(
+      element_id=element_id, config=_encode(config), data=_encode(data))
+  return element, script
+
+
+def render_encoded_components(
+    encoded_components):
+  """Renders components returned by encode_component in one display call.
+
+  Args:
+    encoded_components: A list of results of encode_component.
+  """
   display.display(
-      display.HTML("""
-          <link rel="import"
-          href="/nbextensions/tfma_widget_js/vulcanized_template.html">
-          <{component_name} id="component"></{component_name}>
-          <script>
-          const element = document.getElementById('component');
-          element.config = JSON.parse('{config}');
-          element.data = JSON.parse('{data}');
-          </script>
-          """.format(
-              component_name=component_name,
-              config=json.dumps(config),
-              data=json.dumps(data))))
+      display.HTML(
+          _TEMPLATE.format(
+              elements='\n          '.join(
+                  element for element, _ in encoded_components),
+              scripts='\n          '.join(
+                  script for _, script in encoded_components))))
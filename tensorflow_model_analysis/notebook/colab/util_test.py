@@ -0,0 +1,81 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Colab renderer util."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+
+import numpy as np
+import tensorflow as tf
+from tensorflow_model_analysis.notebook.colab import util
+
+
+class UtilTest(tf.test.TestCase):
+
+  def _encodeWithAndWithoutOrjson(self, obj):
+    """Returns obj encoded with orjson (if installed) and with json."""
+    original_orjson = util.orjson
+    encoded = []
+    try:
+      if original_orjson is not None:
+        encoded.append(util._encode(obj))  # pylint: disable=protected-access
+      util.orjson = None
+      encoded.append(util._encode(obj))  # pylint: disable=protected-access
+    finally:
+      util.orjson = original_orjson
+    return encoded
+
+  def testEncode(self):
+    payload = {
+        'float32': np.float32(0.1),
+        'float32_array': np.array([[0.1, 0.2]], dtype=np.float32),
+        'int64': np.int64(3),
+        'array': np.array([1.0, 2.0]),
+        'nan': float('nan'),
+        'inf': np.float64('inf'),
+        'tuple': (1, 'a'),
+        'text': u'line\u2028separator',
+        1: 'int key',
+    }
+    expected = {
+        'float32': 0.1,
+        'float32_array': [[0.1, 0.2]],
+        'int64': 3,
+        'array': [1.0, 2.0],
+        'nan': None,
+        'inf': None,
+        'tuple': [1, 'a'],
+        'text': u'line\u2028separator',
+        '1': 'int key',
+    }
+    for encoded in self._encodeWithAndWithoutOrjson(payload):
+      self.assertNotIn(u'\u2028', encoded)
+      self.assertEqual(expected, json.loads(encoded))
+
+  def testEncodeFinitePayload(self):
+    payload = {'float32': np.float32(0.1), 'array': np.arange(3)}
+    expected = {'float32': 0.1, 'array': [0, 1, 2]}
+    for encoded in self._encodeWithAndWithoutOrjson(payload):
+      self.assertEqual(expected, json.loads(encoded))
+
+  def testEncodeWideInteger(self):
+    for encoded in self._encodeWithAndWithoutOrjson({'big': 2**70}):
+      self.assertEqual({'big': 2**70}, json.loads(encoded))
+
+
+if __name__ == '__main__':
+  tf.test.main()
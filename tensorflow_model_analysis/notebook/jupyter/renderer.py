@@ -13,6 +13,9 @@
 # limitations under the License.
 """Jupyter renderer API."""
 
+import contextlib
+
+from IPython import display
 import tensorflow_model_analysis.notebook.jupyter.tfma_widget as tfma_widget
 
 
@@ -65,3 +68,36 @@ def render_plot(data, config):
   view.config = config
 
   return view
+
+
+def render_components(components):
+  """Renders multiple views in Jupyter.
+
+  Args:
+    components: A list of (component_name, data, config) tuples, where
+      component_name is one of 'tfma-nb-slicing-metrics', 'tfma-nb-time-series'
+      or 'tfma-nb-plot'.
+  """
+  for component_name, data, config in components:
+    display.display(_RENDERERS[component_name](data, config))
+
+
+def start_batch():
+  """No-op. Jupyter widgets are displayed independently of each other."""
+
+
+def flush_batch():
+  """No-op. Jupyter widgets are displayed independently of each other."""
+
+
+@contextlib.contextmanager
+def batch():
+  """No-op context manager, mirroring the Colab renderer's batch()."""
+  yield
+
+
+_RENDERERS = {
+    'tfma-nb-slicing-metrics': render_slicing_metrics,
+    'tfma-nb-time-series': render_time_series,
+    'tfma-nb-plot': render_plot,
+}
@@ -54,6 +54,10 @@ class ValueWithConfidenceInterval(
     ])):
   """Represents a value with mean, upper, and lower bound."""
 
+  # One of these is created per (slice, metric), so don't give each instance a
+  # __dict__ like a regular NamedTuple subclass would have.
+  __slots__ = ()
+
   def __new__(
       cls,
       value,
@@ -83,14 +87,38 @@ FeaturesPredictionsLabels = NamedTuple(
                                   ('predictions', DictOfFetchedTensorValues),
                                   ('labels', DictOfFetchedTensorValues)])
 
+# Canonical MaterializedColumn names, see MaterializedColumn.__new__. Keyed by
+# (type, name) since in Python 2 u'x' == 'x', and a name should not change
+# between str and unicode. This is never cleared, so it holds every distinct
+# name seen in the process; names are feature keys, so in practice the set is
+# small and fixed.
+_MATERIALIZED_COLUMN_NAMES = {}  # type: Dict[Tuple[Any, Text], Text]
+
+
 # Used in building the model diagnostics table, a MaterializedColumn is a value
 # inside of Extracts that will be emitted to file. Note that for strings, the
 # values are raw byte strings rather than unicode strings. This is by design, as
 # features can have arbitrary bytes values.
-MaterializedColumn = NamedTuple(
-    'MaterializedColumn',
-    [('name', Text),
-     ('value', Union[List[bytes], List[int], List[float], bytes, int, float])])
+class MaterializedColumn(
+    NamedTuple(
+        'MaterializedColumn',
+        [('name', Text),
+         ('value',
+          Union[List[bytes], List[int], List[float], bytes, int, float])])):
+  """A named value inside of Extracts that will be emitted to file."""
+
+  __slots__ = ()
+
+  def __new__(cls, name, value):
+    # Names come from a small, fixed set of feature keys but are rebuilt for
+    # every example, so share a single copy of each. Callers storing columns
+    # in Extracts should key them by the returned column's name so that they
+    # do not keep their own copy alive. Note that _replace and _make bypass
+    # __new__ and so keep whatever name object they are given, and that Extracts
+    # keys restored by unpickling are not pooled.
+    name = _MATERIALIZED_COLUMN_NAMES.setdefault((type(name), name), name)
+    return super(MaterializedColumn, cls).__new__(cls, name, value)
+
 
 # Extracts represent data extracted during pipeline processing. In order to
 # provide a flexible API, these types are just dicts where the keys are defined
@@ -101,9 +129,17 @@ Extracts = Dict[Text, Any]
 
 # pylint: enable=invalid-name
 
+_TENSOR_TYPES = (tf.Tensor, tf.SparseTensor)
+
+# Default shared handles for EvalSharedModels constructed without metrics
+# callbacks or a construct_fn, keyed by (model_path, include_default_metrics).
+# Those are the only inputs to the graph loaded for such models; anything with
+# callbacks or a custom construct_fn gets a fresh handle.
+_DEFAULT_SHARED_HANDLES = {}  # type: Dict[Tuple[Text, bool], shared.Shared]
+
 
 def is_tensor(obj):
-  return isinstance(obj, tf.Tensor) or isinstance(obj, tf.SparseTensor)
+  return isinstance(obj, _TENSOR_TYPES)
 
 
 class EvalSharedModel(
@@ -133,7 +169,13 @@ class EvalSharedModel(
     example_weight_key: The key of the example weight column. If None, weight
       will be 1 for each example.
     shared_handle: Optional handle to a shared.Shared object for sharing the
-      in-memory model within / between stages.
+      in-memory model within / between stages. If not set and neither
+      add_metrics_callbacks nor construct_fn is given, a handle shared by all
+      such EvalSharedModels with the same model_path and
+      include_default_metrics in this process is used. The model loaded
+      through it is reused for as long as any of them is alive, so if a new
+      model is exported to the same model_path within one process, pass a
+      fresh shared.Shared() here to load the new model.
     construct_fn: A callable which creates a construct function
       to set up the tensorflow graph. Callable takes a beam.metrics distribution
       to track graph construction time.
@@ -172,7 +214,14 @@ class EvalSharedModel(
     if not add_metrics_callbacks:
       add_metrics_callbacks = []
     if not shared_handle:
-      shared_handle = shared.Shared()
+      if not add_metrics_callbacks and construct_fn is None:
+        key = (model_path, include_default_metrics)
+        shared_handle = _DEFAULT_SHARED_HANDLES.get(key)
+        if shared_handle is None:
+          shared_handle = _DEFAULT_SHARED_HANDLES.setdefault(
+              key, shared.Shared())
+      else:
+        shared_handle = shared.Shared()
     return super(EvalSharedModel, cls).__new__(
         cls, model_path, add_metrics_callbacks, include_default_metrics,
         example_weight_key, shared_handle, construct_fn)
@@ -0,0 +1,98 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Simple tests for types."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import tensorflow as tf
+from tensorflow_model_analysis import types
+from tensorflow_transform.beam import shared
+
+
+class _LoadedModel(object):
+  """Stands in for a loaded model held by a shared.Shared handle."""
+
+
+class TypesTest(tf.test.TestCase):
+
+  def testEvalSharedModelDefaultHandleIsShared(self):
+    model1 = types.EvalSharedModel(model_path='/path/to/model')
+    model2 = types.EvalSharedModel(model_path='/path/to/model')
+    self.assertIs(model1.shared_handle, model2.shared_handle)
+
+  def testEvalSharedModelDefaultHandleDependsOnModel(self):
+    model = types.EvalSharedModel(model_path='/path/to/model')
+    other_path = types.EvalSharedModel(model_path='/path/to/other_model')
+    no_default_metrics = types.EvalSharedModel(
+        model_path='/path/to/model', include_default_metrics=False)
+    with_callbacks = types.EvalSharedModel(
+        model_path='/path/to/model', add_metrics_callbacks=[lambda *_: {}])
+    self.assertIsNot(model.shared_handle, other_path.shared_handle)
+    self.assertIsNot(model.shared_handle, no_default_metrics.shared_handle)
+    self.assertIsNot(model.shared_handle, with_callbacks.shared_handle)
+
+  def testEvalSharedModelDistinctConstructFnsGetDistinctHandles(self):
+    model1 = types.EvalSharedModel(
+        model_path='/path/to/model', construct_fn=lambda _: None)
+    model2 = types.EvalSharedModel(
+        model_path='/path/to/model', construct_fn=lambda _: None)
+    model3 = types.EvalSharedModel(construct_fn=lambda _: None)
+    model4 = types.EvalSharedModel(construct_fn=lambda _: None)
+    self.assertIsNot(model1.shared_handle, model2.shared_handle)
+    self.assertIsNot(model3.shared_handle, model4.shared_handle)
+
+  def testEvalSharedModelExplicitHandle(self):
+    handle = types.EvalSharedModel(
+        model_path='/path/to/other').shared_handle
+    model = types.EvalSharedModel(
+        model_path='/path/to/model', shared_handle=handle)
+    self.assertIs(handle, model.shared_handle)
+
+  def testEvalSharedModelReexportedModelNeedsFreshHandle(self):
+    old_loaded_model = _LoadedModel()
+    old_model = types.EvalSharedModel(model_path='/path/to/reexported')
+    self.assertIs(old_loaded_model,
+                  old_model.shared_handle.acquire(lambda: old_loaded_model))
+
+    # After re-exporting to the same path, the default handle still holds the
+    # old model while it is alive.
+    same_path_model = types.EvalSharedModel(model_path='/path/to/reexported')
+    self.assertIs(old_loaded_model,
+                  same_path_model.shared_handle.acquire(_LoadedModel))
+
+    new_model = types.EvalSharedModel(
+        model_path='/path/to/reexported', shared_handle=shared.Shared())
+    self.assertIsNot(old_loaded_model,
+                     new_model.shared_handle.acquire(_LoadedModel))
+
+  def testMaterializedColumnSharesNames(self):
+    name1 = ''.join(['features__', 'age'])
+    name2 = ''.join(['features__', 'age'])
+    self.assertIsNot(name1, name2)
+    column1 = types.MaterializedColumn(name=name1, value=[1])
+    column2 = types.MaterializedColumn(name=name2, value=[2])
+    self.assertEqual(name1, column1.name)
+    self.assertIs(column1.name, column2.name)
+
+  def testMaterializedColumnKeepsNameType(self):
+    text_column = types.MaterializedColumn(name=u'features__id', value=[1])
+    bytes_column = types.MaterializedColumn(name=b'features__id', value=[1])
+    self.assertIsInstance(text_column.name, type(u''))
+    self.assertIsInstance(bytes_column.name, type(b''))
+
+
+if __name__ == '__main__':
+  tf.test.main()